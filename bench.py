@@ -0,0 +1,280 @@
+# 성능 측정용 벤치마크 (로컬 SQLite 저장소만 사용, Supabase 불필요)
+#
+#   python bench.py                         # 기본 크기 (학습 기록 1만/10만 행)
+#   python bench.py --log-sizes 10000,1000000 --out bench.json
+#   python bench.py --compare old.json      # 이전 결과와 비교 (비율 > 1 이면 느려짐)
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# main 을 import 하기 전에 로컬 저장소로 고정 (import 때 만들어지는 저장소는 쓰지 않으므로 메모리에)
+os.environ['STORAGE_BACKEND'] = 'sqlite'
+os.environ['SQLITE_PATH'] = ':memory:'
+TMP_DIR = None      # 실행하는 동안만 있는 임시 디렉터리 (scratch_dir)
+
+import pandas as pd
+import main
+
+TYPES = ['빈칸', '순서', '삽입', '요약', '주제', '어법']
+WORDS = ("the student teacher reading passage because although however important result research people "
+         "often usually should would language learning example different between several experience "
+         "environment information children society develop problem believe consider suggest evidence").split()
+
+# ---------------------------------------------------------
+# 합성 데이터
+# ---------------------------------------------------------
+def _sentence(rng, lo=12, hi=25, underline=False):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(lo, hi))]
+    words[0] = words[0].capitalize()
+    if underline:
+        i = rng.randrange(len(words))
+        words[i] = f"<u>{words[i]}</u>"
+    return ' '.join(words) + rng.choice(['.', '.', '.', '?', '!'])
+
+def make_problem_set(n, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        n_sent = rng.randint(8, 14)
+        sents = [_sentence(rng, underline=rng.random() < 0.1) for _ in range(n_sent)]
+        options = [_sentence(rng, 4, 10) for _ in range(5)]
+        # 실제 데이터처럼 JSON 배열 문자열과 '^' 구분 문자열이 섞여 있다
+        opt_raw = str(options) if i % 2 else '^'.join(options)
+        rows.append({
+            'id': str(i + 1),
+            'type': TYPES[i % len(TYPES)],
+            'question_text': '다음 글의 주제로 가장 적절한 것은?' if i % 3 else None,
+            'passage': ' '.join(sents),
+            'translation': ' '.join(f"해석 문장 {k + 1}." for k in range(n_sent)),
+            'options': opt_raw,
+            'options_translation': str([f"보기 해석 {k + 1}" for k in range(5)]),
+            'answer': str(rng.randint(1, 5)),
+            'explanation': '해설 ' * 20,
+            'extra_content': _sentence(rng) if TYPES[i % len(TYPES)] == '삽입' else None,
+        })
+    return rows
+
+def make_study_logs(n, problem_ids, n_students=200, seed=0):
+    rng = random.Random(seed)
+    students = [f"s{k:04d}" for k in range(n_students)]
+    start = time.mktime((2024, 3, 1, 9, 0, 0, 0, 0, -1))
+    rows = []
+    for i in range(n):
+        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start + i * 37))
+        first, final = str(rng.randint(1, 5)), str(rng.randint(1, 5))
+        rows.append({
+            'timestamp': ts,
+            'user_id': rng.choice(students),
+            'problem_id': rng.choice(problem_ids),
+            'mode': 'practice' if rng.random() < 0.7 else 'mock',
+            'is_correct': rng.choice('OX'),
+            'first_answer': first,
+            'final_answer': final,
+            'viewed_sentences': ', '.join(map(str, sorted(rng.sample(range(10), rng.randint(0, 3))))),
+            'viewed_options': ', '.join(map(str, sorted(rng.sample(range(5), rng.randint(0, 2))))),
+            'unknown_words': ', '.join(sorted(rng.sample(WORDS, rng.randint(0, 4)))),
+            'duration': rng.randint(20, 400),
+        })
+    return rows
+
+@contextlib.contextmanager
+def scratch_dir():
+    # 측정용 SQLite 파일(수백 MB 가 될 수 있음)은 끝나면 지운다
+    global TMP_DIR
+    TMP_DIR = tempfile.mkdtemp(prefix='hw-bench-')
+    try:
+        yield TMP_DIR
+    finally:
+        shutil.rmtree(TMP_DIR, ignore_errors=True)
+        TMP_DIR = None
+
+def seed_storage(path, problems, logs):
+    if os.path.exists(path): os.remove(path)
+    st = main.SQLiteStorage(path)
+    st.insert('problem_set', problems)
+    st.insert('users', [{'id': f"s{k:04d}", 'password': 'pw', 'name': f"학생{k}"} for k in range(200)])
+    for i in range(0, len(logs), 50_000):
+        st.insert('study_logs', logs[i:i + 50_000])
+    return st
+
+# ---------------------------------------------------------
+# 측정 도구
+# ---------------------------------------------------------
+def timeit(fn, repeat=5, number=1):
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(number): fn()
+            times.append((time.perf_counter() - t0) * 1000 / number)
+    return {'min': round(min(times), 4), 'median': round(statistics.median(times), 4),
+            'mean': round(statistics.fmean(times), 4), 'repeat': repeat, 'number': number}
+
+class Results:
+    def __init__(self):
+        self.items = []
+
+    def add(self, name, ms, **params):
+        extra = params.pop('extra', {})
+        self.items.append({'name': name, 'params': params, 'ms': ms, **extra})
+        label = ', '.join(f"{k}={v}" for k, v in params.items())
+        print(f"{name:<32} {label:<28} median {ms['median']:>10.3f} ms", file=sys.stderr)
+
+# ---------------------------------------------------------
+# 벤치마크
+# ---------------------------------------------------------
+def bench_frames(res, st, n_logs):
+    main.storage = st
+    res.add('fetch_data.problem_set', timeit(lambda: main.fetch_data('problem_set'), repeat=3), n_logs=n_logs)
+    res.add('fetch_data.study_logs', timeit(lambda: main.fetch_data('study_logs'), repeat=3), n_logs=n_logs)
+    res.add('fetch_data.study_logs.projection', timeit(lambda: main.fetch_data('study_logs', ['id', 'user_id', 'timestamp']), repeat=3), n_logs=n_logs)
+    # Supabase 응답(JSON 리스트) → DataFrame 변환만 따로
+    records = st.select_page('study_logs', '*', [], 'id', 0, min(n_logs, 100_000) - 1)
+    res.add('frame_build.records', timeit(lambda: main._clean_frame(pd.DataFrame(records))), rows=len(records))
+
+def bench_snapshot(res, problems):
+    df = main._clean_frame(pd.DataFrame(problems))
+    res.add('snapshot.build', timeit(lambda: main.ProblemSnapshot(df, 1), repeat=3), problems=len(problems))
+    return df, main.ProblemSnapshot(df, 1)
+
+def bench_selection(res, df, snap):
+    type_col = snap.type_col
+    ids = df['id'].tolist()
+    solved = set(random.Random(1).sample(ids, len(ids) // 2))
+
+    def legacy_draw():
+        # 이전 load_question: 전체 마스크 + sample
+        cond = ~df['id'].isin(solved) & (df[type_col] == TYPES[0])
+        rem = df[cond]
+        if not rem.empty: rem.sample(1).iloc[0]
+
+    res.add('select.legacy_mask_sample', timeit(legacy_draw, repeat=5, number=20), problems=len(df))
+    res.add('select.sampler_build', timeit(lambda: main.QuestionSampler(snap, solved), repeat=5), problems=len(df))
+    sampler = main.QuestionSampler(snap, solved)
+    res.add('select.sampler_draw', timeit(lambda: sampler.draw(TYPES[0]), repeat=5, number=1000), problems=len(df))
+
+    def draw_and_mark():
+        qid = sampler.draw()
+        if qid is not None: sampler.mark_solved(qid)
+    res.add('select.sampler_draw_mark', timeit(draw_and_mark, repeat=5, number=100), problems=len(df))
+
+def bench_render(res, snap):
+    from nicegui import Client, ui
+    from nicegui.page import page
+
+    questions = list(snap.questions.values())[:20]
+    for mode in ('label', 'html'):
+        main.TEXT_RENDER_MODE = mode
+        client = Client(page('/'), request=None)
+        with client:
+            hw = main.HomeworkApp()
+            hw.main_container = ui.column()
+        base = len(client.elements)
+        counts = []
+
+        def render(q):
+            hw.current_q = q
+            hw.submission_stage = 0
+            with client:
+                hw.render_question_page()
+            counts.append(len(client.elements) - base)
+
+        ms = timeit(lambda: [render(q) for q in questions], repeat=3)
+        ms = {k: (round(v / len(questions), 4) if k in ('min', 'median', 'mean') else v) for k, v in ms.items()}
+        res.add('render.question_page', ms, mode=mode,
+                extra={'elements': {'min': min(counts), 'max': max(counts), 'mean': round(statistics.fmean(counts), 1)}})
+
+        # 힌트 토글(부분 갱신)
+        hw.current_q = questions[0]
+        with client:
+            hw.render_question_page()
+            res.add('render.toggle_hint', timeit(lambda: hw.toggle_hint(0), repeat=5, number=50), mode=mode)
+        client.remove_all_elements()
+    main.TEXT_RENDER_MODE = 'html'
+
+def bench_admin(res, st, n_logs):
+    main.storage = st
+    with contextlib.redirect_stdout(io.StringIO()):
+        logs_df = main.fetch_data('study_logs') if n_logs <= 200_000 else None
+    stu, date = 's0001', None
+    if logs_df is not None:
+        def legacy():
+            stu_logs = logs_df[logs_df['user_id'] == stu]
+            dates = sorted(set(t.split(' ')[0] for t in stu_logs['timestamp']), reverse=True)
+            logs_df[(logs_df['user_id'] == stu) & (logs_df['timestamp'].str.startswith(dates[0]))].sort_values('timestamp')
+        res.add('admin.legacy_filter', timeit(legacy, repeat=3), n_logs=n_logs)
+
+    index = main.StudyLogIndex()
+    res.add('admin.index_build', timeit(index.build, repeat=1), n_logs=n_logs)
+    date = index.dates(stu)[0]
+    res.add('admin.index_dates', timeit(lambda: index.dates(stu), repeat=5, number=100), n_logs=n_logs)
+    res.add('admin.day_query', timeit(lambda: st.fetch_day_logs(stu, date), repeat=5), n_logs=n_logs)
+
+# ---------------------------------------------------------
+def git_rev():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)), text=True).strip()
+    except Exception:
+        return None
+
+def compare(current, old_path):
+    with open(old_path, encoding='utf-8') as f:
+        old = {(r['name'], json.dumps(r['params'], sort_keys=True)): r for r in json.load(f)['results']}
+    print(f"\n{'name':<32} {'params':<28} {'old':>10} {'new':>10} {'ratio':>7}", file=sys.stderr)
+    for r in current:
+        key = (r['name'], json.dumps(r['params'], sort_keys=True))
+        if key not in old: continue
+        o, n = old[key]['ms']['median'], r['ms']['median']
+        ratio = n / o if o else float('inf')
+        flag = '  ⚠' if ratio > 1.2 else ''
+        print(f"{r['name']:<32} {json.dumps(r['params']):<28} {o:>10.3f} {n:>10.3f} {ratio:>7.2f}{flag}", file=sys.stderr)
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="영어 숙제장 핫패스 벤치마크")
+    parser.add_argument('--problems', type=int, default=2000)
+    parser.add_argument('--log-sizes', default='10000,100000', help="쉼표로 구분 (예: 10000,100000,1000000)")
+    parser.add_argument('--skip-render', action='store_true')
+    parser.add_argument('--out', help="결과 JSON 파일 (없으면 stdout)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+    with scratch_dir():
+        run(args)
+
+def run(args):
+    res = Results()
+    problems = make_problem_set(args.problems)
+    df, snap = bench_snapshot(res, problems)
+    bench_selection(res, df, snap)
+    if not args.skip_render: bench_render(res, snap)
+
+    ids = [p['id'] for p in problems]
+    for n in (int(x) for x in args.log_sizes.split(',') if x):
+        st = seed_storage(os.path.join(TMP_DIR, f'logs-{n}.db'), problems, make_study_logs(n, ids))
+        bench_frames(res, st, n)
+        bench_admin(res, st, n)
+
+    out = {
+        'meta': {'git': git_rev(), 'python': platform.python_version(), 'pandas': pd.__version__,
+                 'platform': platform.platform(), 'time': time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 'problems': args.problems, 'log_sizes': args.log_sizes},
+        'results': res.items,
+    }
+    text = json.dumps(out, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f: f.write(text)
+    else:
+        print(text)
+    if args.compare: compare(res.items, args.compare)
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,230 @@
+# 동시 접속 부하 테스트 (로컬 SQLite 저장소, 프로세스 내부에서 NiceGUI 클라이언트 N개를 흉내낸다)
+#
+#   python loadtest.py --clients 50 --questions 3
+#   python loadtest.py --clients 200 --think 200 --out load.json
+#
+# 각 가상 클라이언트는 실제 탭과 같이 Client + HomeworkApp 를 하나씩 갖고
+# 로그인 → 유형 선택 → 힌트 토글 → 단어 클릭 → 1차/최종 제출 → 다음 문제 순서로 핸들러를 직접 호출한다.
+# 웹소켓으로 나갈 데이터는 Outbox 에 쌓인 업데이트/메시지를 직렬화해서 크기를 잰다.
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import bench   # main 보다 먼저: 로컬 저장소 환경변수 설정
+import main
+from nicegui import Client, core, ui
+from nicegui.page import page
+
+def pct(values, p):
+    if not values: return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * p / 100))], 3)
+
+class Stats:
+    def __init__(self):
+        self.latency = {}       # {action: [ms, ...]}
+        self.bytes = {}         # {action: [bytes, ...]}
+        self.errors = {}
+
+    def summary(self):
+        out = {}
+        for action, values in self.latency.items():
+            sizes = self.bytes.get(action, [])
+            out[action] = {
+                'count': len(values),
+                'p50_ms': pct(values, 50), 'p99_ms': pct(values, 99), 'max_ms': round(max(values), 3),
+                'ws_bytes_mean': round(statistics.fmean(sizes)) if sizes else 0,
+                'ws_bytes_max': max(sizes) if sizes else 0,
+            }
+        return out
+
+class LoopLag:
+    # 이벤트 루프가 얼마나 늦게 깨어나는지 (= 다른 접속자가 체감하는 멈춤)
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        while True:
+            t0 = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append((time.perf_counter() - t0 - self.interval) * 1000)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        self._task.cancel()
+
+class VirtualClient:
+    def __init__(self, idx, stats, think):
+        self.idx = idx
+        self.stats = stats
+        self.think = think
+        self.client = Client(page('/'), request=None)
+        with self.client:
+            self.hw = main.HomeworkApp()
+            self.hw.main_container = ui.column()
+            self.hw.start_login()
+        self._drain()
+
+    def _drain(self):
+        # Outbox.loop 가 보낼 내용과 같은 형태로 직렬화해서 크기만 재고 비운다
+        outbox = self.client.outbox
+        data = {eid: (None if el is None or not hasattr(el, '_to_dict') else el._to_dict()) for eid, el in list(outbox.updates.items())}
+        size = len(json.dumps(data, default=str)) if data else 0
+        for msg in outbox.messages:
+            size += len(json.dumps(msg, default=str))
+        outbox.updates.clear()
+        outbox.messages.clear()
+        return size
+
+    async def act(self, name, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            with self.client:
+                result = fn(*args)
+                if asyncio.iscoroutine(result): await result
+        except Exception as e:
+            self.stats.errors[name] = self.stats.errors.get(name, 0) + 1
+            if self.stats.errors[name] == 1: print(f"[{name}] {type(e).__name__}: {e}", file=sys.stderr)
+        self.stats.latency.setdefault(name, []).append((time.perf_counter() - t0) * 1000)
+        self.stats.bytes.setdefault(name, []).append(self._drain())
+        # 실제로는 이벤트마다 별도의 웹소켓 메시지이므로, 대기 시간이 0 이어도 루프에 한 번 양보한다
+        await asyncio.sleep(random.uniform(0.5, 1.5) * self.think if self.think else 0)
+
+    def _word_ids(self, n):
+        q = self.hw.current_q
+        words = [f"sent_{i}_{k}_{w.key}" for i, ws in q.sentences for k, w in enumerate(ws)]
+        return random.sample(words, min(n, len(words)))
+
+    def _click_words(self, n):
+        if main.TEXT_RENDER_MODE == 'html':
+            # 브라우저 리스너가 모아서 보내는 한 번의 이벤트
+            self.hw.on_word_toggle(SimpleNamespace(args={'ids': self._word_ids(n)}))
+        else:
+            labels = [el for el in self.client.elements.values() if isinstance(el, ui.label) and 'cursor-pointer' in el._classes]
+            for k, lbl in enumerate(random.sample(labels, min(n, len(labels)))):
+                self.hw.toggle_word(lbl, f"w{k}")
+
+    def _choose(self):
+        if self.hw.radio_comp and self.hw.radio_comp.options:
+            self.hw.radio_comp.value = random.choice(self.hw.radio_comp.options)
+
+    async def run(self, n_questions):
+        hw = self.hw
+        hw.id_input.value, hw.pw_input.value = f"s{self.idx % 200:04d}", 'pw'
+        await self.act('login', hw.process_login)
+        await self.act('select_type', hw.select_practice_type)
+        q_type = random.choice(bench.TYPES)
+        await self.act('load_question', hw.load_question, q_type)
+        for _ in range(n_questions):
+            if hw.current_q is None: break
+            n_sent = len(hw.current_q.sentences)
+            for i in random.sample(range(n_sent), min(3, n_sent)):
+                await self.act('toggle_hint', hw.toggle_hint, i)
+            await self.act('toggle_opt_hint', hw.toggle_opt_hint, 0)
+            for _ in range(2):
+                await self.act('word_click', self._click_words, 4)
+            self._choose()
+            await self.act('submit_first', hw.submit_handler)
+            self._choose()
+            await self.act('submit_final', hw.submit_final)
+            await self.act('next', hw.load_question, q_type)
+
+async def measure_session_memory(n):
+    # tracemalloc 은 느려서 지연 측정과 따로: 세션 n 개를 문제 화면까지 띄운 뒤 늘어난 메모리 / n
+    tracemalloc.start()
+    mem0 = tracemalloc.get_traced_memory()[0]
+    clients = [VirtualClient(10_000 + i, Stats(), 0) for i in range(n)]
+    for c in clients:
+        await c.run(0)
+    mem1 = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return round((mem1 - mem0) / max(1, n))
+
+async def run(args):
+    problems = bench.make_problem_set(args.problems)
+    ids = [p['id'] for p in problems]
+    st = bench.seed_storage(os.path.join(bench.TMP_DIR, 'load.db'), problems, bench.make_study_logs(args.logs, ids))
+    main.storage = st
+    main.TEXT_RENDER_MODE = args.mode
+    # 자격 증명 해시 비용은 로그인 부하의 일부지만, 너무 크면 다른 지표를 가리므로 조절 가능
+    main.HASH_ITERATIONS = args.hash_iterations
+
+    core.loop = asyncio.get_running_loop()      # ui.run 없이 background_tasks 를 쓰기 위해
+    # 앱 기동 때와 같은 준비 단계 (공용 문제 세트는 세션 메모리에 섞이지 않도록 미리 올려 둔다)
+    main.WARM_LOG_INDEX = False
+    await main.startup.warm()
+
+    writer = asyncio.create_task(main.log_writer.run())
+    stats = Stats()
+    clients = [VirtualClient(i, stats, args.think / 1000) for i in range(args.clients)]
+
+    lag = LoopLag()
+    lag.start()
+    t0 = time.perf_counter()
+    await asyncio.gather(*(c.run(args.questions) for c in clients))
+    elapsed = time.perf_counter() - t0
+    lag.stop()
+    await main.log_writer.flush()
+    writer.cancel()
+
+    elements = [len(c.client.elements) for c in clients]
+    memory = await measure_session_memory(min(args.clients, 20))
+    out = {
+        'meta': {'git': bench.git_rev(), 'clients': args.clients, 'questions': args.questions, 'mode': args.mode,
+                 'think_ms': args.think, 'problems': args.problems, 'logs': args.logs, 'time': time.strftime("%Y-%m-%dT%H:%M:%S")},
+        'elapsed_s': round(elapsed, 3),
+        'actions': stats.summary(),
+        'errors': stats.errors,
+        'loop_lag_ms': {'p50': pct(lag.samples, 50), 'p99': pct(lag.samples, 99), 'max': round(max(lag.samples), 3) if lag.samples else None},
+        'per_session': {'memory_bytes': memory,
+                        'elements_mean': round(statistics.fmean(elements), 1), 'elements_max': max(elements)},
+        'log_writer': {'flushed': main.log_writer.flushed, 'depth': main.log_writer.depth,
+                       'last_flush_latency_ms': round((main.log_writer.last_flush_latency or 0) * 1000, 3)},
+        'coalesced_reads': main.db.coalesced,
+    }
+    return out
+
+def print_summary(out):
+    print(f"\n{out['meta']['clients']} clients, {out['elapsed_s']} s, mode={out['meta']['mode']}", file=sys.stderr)
+    print(f"{'action':<16} {'n':>6} {'p50 ms':>9} {'p99 ms':>9} {'ws bytes':>9}", file=sys.stderr)
+    for action, a in out['actions'].items():
+        print(f"{action:<16} {a['count']:>6} {a['p50_ms']:>9} {a['p99_ms']:>9} {a['ws_bytes_mean']:>9}", file=sys.stderr)
+    print(f"loop lag p50/p99/max: {out['loop_lag_ms']['p50']} / {out['loop_lag_ms']['p99']} / {out['loop_lag_ms']['max']} ms", file=sys.stderr)
+    ps = out['per_session']
+    print(f"per session: {ps['memory_bytes'] / 1024:.1f} KiB, {ps['elements_mean']} elements", file=sys.stderr)
+    if out['errors']: print(f"errors: {out['errors']}", file=sys.stderr)
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="영어 숙제장 동시 접속 부하 테스트")
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--questions', type=int, default=3, help="클라이언트당 풀 문제 수")
+    parser.add_argument('--think', type=float, default=0, help="동작 사이 평균 대기(ms)")
+    parser.add_argument('--mode', default=main.TEXT_RENDER_MODE, choices=['html', 'label'])
+    parser.add_argument('--problems', type=int, default=1000)
+    parser.add_argument('--logs', type=int, default=10000)
+    parser.add_argument('--hash-iterations', type=int, default=main.HASH_ITERATIONS)
+    parser.add_argument('--out', help="결과 JSON 파일 (없으면 stdout)")
+    args = parser.parse_args()
+
+    with bench.scratch_dir():
+        out = asyncio.run(run(args))
+    print_summary(out)
+    text = json.dumps(out, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f: f.write(text)
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main_cli()